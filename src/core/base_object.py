@@ -1,8 +1,48 @@
+import heapq
+import itertools
+import sys
+import time
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from typing import *
 
+from logger.level import Level
 from logger.logger import Logger
 
 
+class _LoggerDescriptor:
+    """
+    A descriptor that resolves the logger of a class the first time it is accessed.
+
+    Every BaseObject class gets its own descriptor. On first access it creates the
+    logger and replaces itself with it on the class, so later lookups are plain
+    class attribute loads and every instance of that class shares one logger.
+    """
+
+    def __get__(
+        self,
+        instance: Any,
+        owner: Optional[type] = None,
+    ) -> Logger:
+        """
+        Returns the logger of the owning class, creating it on first access.
+
+        :param instance: The instance the logger is accessed through, or None.
+        :param owner: The class the logger is accessed through.
+        :return: The logger of the class.
+        """
+        cls: type = owner if owner is not None else type(instance)
+        logger: Logger = Logger.get_logger(
+            cls.__name__,
+            level=cls.log_level,
+        )
+
+        cls._logger = logger
+
+        return logger
+
+
 class BaseObject:
     """
     A base class for creating objects that support attribute access
@@ -12,46 +52,47 @@ class BaseObject:
 
     Attributes:
         logger (Logger): An instance of the Logger class to log messages in this class.
+        log_level (Level): The minimum level of the class's logger. Defaults to WARNING;
+            subclasses can override it to see initialization and cache logs.
     """
 
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+    )
+
+    _cls_name: str = "BaseObject"
+
+    log_level: Level = Level.WARNING
+
+    _logger: Logger = _LoggerDescriptor()
+
     def __init__(self) -> None:
         """
         Initializes the BaseObject class.
 
         This method logs a message to indicate that the object has been created and its being initialized.
         """
-        self._logger: Logger = Logger.get_logger(self.__class__.__name__)
-        self._logger.info(message=f"Initialized {self.__class__.__name__}...")
+        logger: Logger = self._logger
 
-    def __delattr__(
-        self,
-        name: str,
-        /,
+        if logger.is_enabled_for(Level.INFO):
+            logger.info(message=f"Initialized {self._cls_name}...")
+
+    def __init_subclass__(
+        cls,
+        **kwargs,
     ) -> None:
         """
-        Deletes an attribute from the object.
+        Records the name of the subclass for use in messages and gives it its own lazy logger.
 
-        :param name: The attribute name to delete.
+        :param kwargs: Keyword arguments passed on to the parent class.
         """
-        del self.__dict__[name]
+        super().__init_subclass__(**kwargs)
 
-    def __getattr__(
-        self,
-        name: str,
-        default: Any = None,
-    ) -> Any:
-        """
-        Gets the value of an attribute or returns a default if not found.
+        cls._cls_name = cls.__name__
 
-        :param name: The attribute name to retrieve.
-        :param default: The default value to return if the attribute is not found.
-        :return: The attribute's value or the default.
-        """
-        return getattr(
-            self.__dict__,
-            name,
-            default,
-        )
+        if "_logger" not in cls.__dict__:
+            cls._logger = _LoggerDescriptor()
 
     def __getitem__(
         self,
@@ -70,25 +111,6 @@ class BaseObject:
             default,
         )
 
-    def __repr__(self) -> str:
-        """
-        Returns a string representation of the object.
-        """
-        return self.__str__()
-
-    def __setattr__(
-        self,
-        name: str,
-        value: Any,
-    ) -> None:
-        """
-        Sets an attribute on the object.
-
-        :param name: The attribute name.
-        :param value: The value to set.
-        """
-        self.__dict__[name] = value
-
     def __setitem__(
         self,
         name: str,
@@ -106,7 +128,9 @@ class BaseObject:
         """
         Returns a string representation of the object, listing all attributes and values.
         """
-        return f"<{self.__class__.__name__}({', '.join(f'{key}={value}' for (key, value,) in self.__dict__.items())})>"
+        return f"<{self._cls_name}({', '.join([f'{key}={value!r}' for (key, value,) in self.__dict__.items()])})>"
+
+    __repr__ = __str__
 
     def to_dict(
         self,
@@ -115,16 +139,42 @@ class BaseObject:
         """
         Returns a dictionary representation of the object, optionally excluding specified attributes.
 
+        Exclusions that are not already set-like, such as lists, are converted
+        to a frozenset once, so each membership test is O(1).
+
         :param exclude: An iterable of attribute names to exclude from the dictionary.
         :return: A dictionary with the object's attributes as key-value pairs.
         """
+        attributes: Dict[str, Any] = self.__dict__
+
+        if not exclude:
+            return attributes.copy()
+
+        if not isinstance(
+            exclude,
+            AbstractSet,
+        ):
+            exclude = frozenset(exclude)
+
+        if len(exclude) < len(attributes):
+            # Dropping the few excluded keys from a copy beats filtering every attribute.
+            result: Dict[str, Any] = attributes.copy()
+
+            for key in exclude:
+                result.pop(
+                    key,
+                    None,
+                )
+
+            return result
+
         return {
             key: value
             for (
                 key,
                 value,
-            ) in self.__dict__.items()
-            if key not in exclude or []
+            ) in attributes.items()
+            if key not in exclude
         }
 
 
@@ -144,6 +194,8 @@ class BaseObjectBuilder(BaseObject):
     build the final object based on the configuration.
     """
 
+    __slots__ = ("_configuration",)
+
     def __init__(self) -> None:
         """
         Initializes the BaseObjectBuilder class.
@@ -195,7 +247,7 @@ class BaseObjectBuilder(BaseObject):
         :return: An object of a type determined by the builder's configuration.
         """
         raise NotImplementedError(
-            f"{self.__class__.__name__} must implement the 'build' method."
+            f"{self._cls_name} must implement the 'build' method."
         )
 
     def kwargs(
@@ -211,6 +263,19 @@ class BaseObjectBuilder(BaseObject):
         self._configuration.update(kwargs)
         return self
 
+    def update(
+        self,
+        mapping: Mapping[str, Any],
+    ) -> Self:
+        """
+        Updates the builder's configuration with the provided mapping.
+
+        :param mapping: A mapping of key-value pairs to merge into the configuration.
+        :return: The updated builder object.
+        """
+        self._configuration |= mapping
+        return self
+
 
 class BaseObjectManager(BaseObject):
     """
@@ -218,34 +283,85 @@ class BaseObjectManager(BaseObject):
     :py:class:`BaseObject`.
 
     The manager provides a cache for objects and a factory for creating new
-    objects. The cache expires after a configurable time limit.
+    objects. Each cache entry expires individually once the configurable time
+    limit has passed since it was added or last updated. If a maximum size is
+    set, the least recently used entry is evicted once the cache grows beyond it.
 
     Attributes:
         cache (Dict[str, Any]): The cache of objects.
+        max_size (Optional[int]): The maximum number of entries in the cache.
         timestamp (datetime): The timestamp of the last cache update.
-        time_limit (int): The time limit in seconds for the cache.
+        time_limit (int): The time limit in seconds for each cache entry.
     """
 
-    def __init__(self, time_limit: int = 300,) -> None:
+    __slots__ = (
+        "_cache",
+        "_deadline_ns",
+        "_expirations",
+        "_max_size",
+        "_sequence",
+        "_time_limit",
+        "_time_limit_ns",
+    )
+
+    def __init__(self, time_limit: int = 300, max_size: Optional[int] = None,) -> None:
         """
         Initializes a BaseObjectManager.
 
-        :param time_limit: The time limit in seconds for the cache. Defaults to 300 seconds.
+        :param time_limit: The time limit in seconds for each cache entry. Defaults to 300 seconds.
+        :param max_size: The maximum number of entries in the cache, or None for no limit. Defaults to None.
         """
         super().__init__()
 
-        self._cache: Dict[str, Any] = {}
+        # Maps each key to its value and the monotonic deadline in nanoseconds of the entry,
+        # ordered from least to most recently used.
+        self._cache: OrderedDict[str, Tuple[Any, int]] = OrderedDict()
+
+        # Min-heap of (deadline, sequence, key) triples used to evict expired entries lazily.
+        # The sequence number breaks ties between equal deadlines so keys are never compared.
+        self._expirations: List[Tuple[int, int, str]] = []
+        self._sequence: Iterator[int] = itertools.count()
+
+        self._max_size: Optional[int] = max_size
         self._time_limit: int = time_limit
-        self._timestamp: datetime = datetime.now()
+        self._time_limit_ns: int = time_limit * 1_000_000_000
+
+        # Monotonic deadline in nanoseconds after which the next expiry sweep is due.
+        self._deadline_ns: int = time.monotonic_ns() + self._time_limit_ns
 
     @property
     def cache(self) -> Dict[str, Any]:
         """
-        Gets the current cache of objects.
+        Gets a snapshot of the current cache of objects.
+
+        The snapshot is a new dictionary that leaves out expired entries. Changes
+        made to it are not written back to the cache; use the cache helper methods
+        to modify the cache.
 
-        :return: The current cache of objects.
+        :return: A snapshot of the cache, mapping each unexpired key to its value.
         """
-        return self._cache
+        now: int = time.monotonic_ns()
+
+        return {
+            key: value
+            for (
+                key,
+                (
+                    value,
+                    deadline,
+                ),
+            ) in self._cache.items()
+            if deadline >= now
+        }
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """
+        Gets the maximum number of entries in the cache.
+
+        :return: The maximum number of entries in the cache, or None if the cache is unbounded.
+        """
+        return self._max_size
 
     @property
     def time_limit(self) -> int:
@@ -261,9 +377,13 @@ class BaseObjectManager(BaseObject):
         """
         Gets the timestamp of the last cache update.
 
+        The timestamp is derived from the monotonic cache deadline on demand.
+
         :return: The timestamp of the last cache update.
         """
-        return self._timestamp
+        elapsed_ns: int = time.monotonic_ns() - self._deadline_ns + self._time_limit_ns
+
+        return datetime.now() - timedelta(microseconds=elapsed_ns // 1_000)
 
     @timestamp.setter
     def timestamp(self, value: datetime,) -> None:
@@ -272,18 +392,28 @@ class BaseObjectManager(BaseObject):
 
         :param value: The new timestamp value.
         """
-        self._timestamp = value
+        elapsed_ns: int = int((datetime.now() - value).total_seconds() * 1_000_000_000)
+
+        self._deadline_ns = time.monotonic_ns() - elapsed_ns + self._time_limit_ns
 
     def _add_to_cache_(self, key: str, value: Any,) -> None:
         """
         Adds the specified entry to the cache.
 
+        Expired entries are evicted before the new entry is stored.
+
         :param key: The key of the entry.
         :param value: The value of the entry.
         """
-        self._cache[key] = value
+        now: int = time.monotonic_ns()
+
+        self._evict_expired_(now)
+        self._store_in_cache_(key, value, now + self._time_limit_ns,)
 
-        self._logger.info(message=f"Added {key} to cache.")
+        logger: Logger = self._logger
+
+        if logger.is_enabled_for(Level.INFO):
+            logger.info(message=f"Added {key} to cache.")
 
     def _check_time_limit_(self) -> bool:
         """
@@ -291,45 +421,102 @@ class BaseObjectManager(BaseObject):
 
         :return: True if the time limit has been reached, False otherwise.
         """
-        return (datetime.now() - self._timestamp).total_seconds() > self._time_limit
+        return time.monotonic_ns() > self._deadline_ns
+
+    def _evict_expired_(self, now: int,) -> None:
+        """
+        Evicts all entries whose deadline has passed.
+
+        Heap entries that no longer match the cached deadline of their key are
+        stale and are discarded without touching the cache.
+
+        :param now: The current monotonic time in nanoseconds.
+        """
+        expirations: List[Tuple[int, int, str]] = self._expirations
+
+        while expirations and expirations[0][0] < now:
+            (
+                deadline,
+                _,
+                key,
+            ) = heapq.heappop(expirations)
+
+            entry: Optional[Tuple[Any, int]] = self._cache.get(key)
+
+            if entry is not None and entry[1] == deadline:
+                del self._cache[key]
 
     def _flush_cache_(self, force: bool = False,) -> None:
         """
         Flushes the cache.
 
-        If the time limit has been reached or if the force parameter is True,
-        the cache is flushed by clearing its contents and resetting the timestamp.
+        If the force parameter is True, the cache is flushed by clearing its
+        contents and resetting the timestamp. Otherwise, once the time limit has
+        been reached, only the expired entries are evicted.
         This method is intended to be called internally by the cache property
         setter.
 
-        :param force: Whether to flush the cache regardless of the time limit.
+        :param force: Whether to flush the whole cache regardless of the time limit.
         :type force: bool
         """
-        if force or self._check_time_limit_():
-            self._cache = {}
-            self._timestamp = datetime.now()
+        if force:
+            self._cache = OrderedDict()
+            self._expirations = []
+        elif self._check_time_limit_():
+            self._evict_expired_(time.monotonic_ns())
+        else:
+            return
 
-            self._logger.info(message="Flushed cache.")
+        self._deadline_ns = time.monotonic_ns() + self._time_limit_ns
+
+        logger: Logger = self._logger
+
+        if logger.is_enabled_for(Level.INFO):
+            logger.info(message="Flushed cache.")
 
     def _get_from_cache_(self, key: str,) -> Any:
         """
         Retrieves the value associated with the specified key from the cache.
 
+        Retrieving an entry marks it as the most recently used.
+
         :param key: The key of the entry.
         :return: The value associated with the key.
 
-        If the key is not found in the cache, a KeyError is raised.
+        If the key is not found in the cache or its entry has expired, a KeyError is raised.
         """
-        return self._cache[key]
+        (
+            value,
+            deadline,
+        ) = self._cache[key]
+
+        if time.monotonic_ns() > deadline:
+            del self._cache[key]
+
+            raise KeyError(key)
+
+        self._cache.move_to_end(key)
+
+        return value
 
     def _is_in_cache_(self, key: str,) -> bool:
         """
         Checks if the specified key is in the cache.
 
         :param key: The key to check.
-        :return: True if the key is in the cache, False otherwise.
+        :return: True if the key is in the cache and has not expired, False otherwise.
         """
-        return key in self._cache
+        entry: Optional[Tuple[Any, int]] = self._cache.get(key)
+
+        if entry is None:
+            return False
+
+        if time.monotonic_ns() > entry[1]:
+            del self._cache[key]
+
+            return False
+
+        return True
 
     def _remove_from_cache_(self, key: str,) -> None:
         """
@@ -342,21 +529,76 @@ class BaseObjectManager(BaseObject):
         """
         del self._cache[key]
 
-        self._logger.info(message=f"Removed {key} from cache.")
+        logger: Logger = self._logger
+
+        if logger.is_enabled_for(Level.INFO):
+            logger.info(message=f"Removed {key} from cache.")
+
+    def _store_in_cache_(self, key: str, value: Any, deadline: int,) -> None:
+        """
+        Stores the specified entry in the cache and schedules its expiration.
+
+        The entry becomes the most recently used one, and the least recently used
+        entry is evicted if the cache exceeds its maximum size. The expiration heap
+        is rebuilt from the cache once stale heap entries outnumber the live ones,
+        which keeps it bounded by the cache size.
+
+        :param key: The key of the entry.
+        :param value: The value of the entry.
+        :param deadline: The monotonic deadline in nanoseconds of the entry.
+        """
+        self._cache[key] = (
+            value,
+            deadline,
+        )
+        self._cache.move_to_end(key)
+
+        if self._max_size is not None and len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+        if len(self._expirations) > 2 * len(self._cache):
+            self._expirations = [
+                (
+                    entry_deadline,
+                    next(self._sequence),
+                    entry_key,
+                )
+                for (
+                    entry_key,
+                    (
+                        _,
+                        entry_deadline,
+                    ),
+                ) in self._cache.items()
+            ]
+            heapq.heapify(self._expirations)
+        else:
+            heapq.heappush(
+                self._expirations,
+                (
+                    deadline,
+                    next(self._sequence),
+                    key,
+                ),
+            )
 
     def _update_in_cache_(self, key: str, value: Any,) -> None:
         """
         Updates the value associated with the specified key in the cache.
 
+        Updating an entry restarts its time limit.
         This method is intended to be called internally by the cache property
         setter.
 
         :param key: The key of the entry.
         :param value: The new value of the entry.
         """
-        self._cache[key] = value
+        self._store_in_cache_(key, value, time.monotonic_ns() + self._time_limit_ns,)
 
-        self._logger.info(message=f"Updated {key} in cache.")
+        logger: Logger = self._logger
+
+        if logger.is_enabled_for(Level.INFO):
+            logger.info(message=f"Updated {key} in cache.")
 
 
 class ImmutableBaseObject(BaseObject):
@@ -372,6 +614,11 @@ class ImmutableBaseObject(BaseObject):
         logger (Logger): An instance of the Logger class to log messages in this class.
     """
 
+    __slots__ = ()
+
+    # Message of the error raised on every mutation attempt; built once per class.
+    _IMMUTABLE_MSG: str = sys.intern("'ImmutableBaseObject' is immutable.")
+
     def __init__(self) -> None:
         """
         Initializes the ImmutableBaseObject class.
@@ -380,6 +627,19 @@ class ImmutableBaseObject(BaseObject):
         """
         super().__init__()
 
+    def __init_subclass__(
+        cls,
+        **kwargs,
+    ) -> None:
+        """
+        Prepares the error message used by instances of the subclass when they are mutated.
+
+        :param kwargs: Keyword arguments passed on to the parent class.
+        """
+        super().__init_subclass__(**kwargs)
+
+        cls._IMMUTABLE_MSG = sys.intern(f"'{cls.__name__}' is immutable.")
+
     def __setattr__(
         self,
         name: str,
@@ -392,11 +652,14 @@ class ImmutableBaseObject(BaseObject):
         :param value: The value to assign.
         :raises AttributeError: Always raises an exception because the class is immutable.
         """
-        self._logger.error(
-            message=f"Cannot set attribute '{name}' in {self.__class__.__name__}."
-        )
+        logger: Logger = self._logger
+
+        if logger.is_enabled_for(Level.ERROR):
+            logger.error(
+                message=f"Cannot set attribute '{name}' in {self._cls_name}."
+            )
 
-        raise AttributeError(f"'{self.__class__.__name__}' is immutable.")
+        raise AttributeError(type(self)._IMMUTABLE_MSG)
 
     def __setitem__(
         self,
@@ -410,11 +673,14 @@ class ImmutableBaseObject(BaseObject):
         :param value: The value to associate with the key.
         :raises AttributeError: Always raises an exception because the class is immutable.
         """
-        self._logger.error(
-            message=f"Cannot set attribute '{name}' in {self.__class__.__name__}."
-        )
+        logger: Logger = self._logger
+
+        if logger.is_enabled_for(Level.ERROR):
+            logger.error(
+                message=f"Cannot set attribute '{name}' in {self._cls_name}."
+            )
 
-        raise AttributeError(f"'{self.__class__.__name__}' is immutable.")
+        raise AttributeError(type(self)._IMMUTABLE_MSG)
 
     def __delattr__(
         self,
@@ -426,8 +692,11 @@ class ImmutableBaseObject(BaseObject):
         :param name: The attribute name to delete.
         :raises AttributeError: Always raises an exception because the class is immutable.
         """
-        self._logger.warn(
-            message=f"Cannot set attribute '{name}' in {self.__class__.__name__}."
-        )
+        logger: Logger = self._logger
+
+        if logger.is_enabled_for(Level.WARNING):
+            logger.warning(
+                message=f"Cannot delete attribute '{name}' in {self._cls_name}."
+            )
 
-        raise AttributeError(f"'{self.__class__.__name__}' is immutable.")
+        raise AttributeError(type(self)._IMMUTABLE_MSG)
@@ -2,7 +2,12 @@ from datetime import datetime
 from pydantic import BaseModel
 from typing import *
 
-from level import Level
+from logger.level import Level
+
+
+# Severity rank of each level, following the declaration order of Level.
+_SEVERITY: Dict[Level, int] = {level: rank for (rank, level,) in enumerate(Level)}
+
 
 class Logger(BaseModel):
     """
@@ -126,15 +131,34 @@ class Logger(BaseModel):
         """
         self.log(message, level=Level.INFO, **kwargs,)
     
+    def is_enabled_for(self, level: Level,) -> bool:
+        """
+        Check whether messages of the given level are emitted by this logger.
+
+        Callers on hot paths use this to skip building messages that would be discarded.
+
+        Args:
+            level (Level): The logging level to check
+
+        Returns:
+            bool: True if the level is at or above the logger's minimum level, False otherwise
+        """
+        return _SEVERITY[level] >= _SEVERITY[self.level]
+
     def log(self, message: str, level: Level = Level.INFO, **kwargs,) -> None:
         """
         Core logging method that handles message formatting and output.
 
+        Messages below the logger's minimum level are discarded.
+
         Args:
             message (str): The log message to output
             level (Level, optional): The severity level of the message. Defaults to Level.INFO
             **kwargs: Additional keyword arguments for future extensibility
         """
+        if not self.is_enabled_for(level):
+            return
+
         print(
             f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [{self.name}] {self._colourise_(level, message)}",
         )